@@ -58,19 +58,37 @@ def update_coords(
     else:
         coords.x += 1
 
-    coords.y = int(
-        sinusoidal_fn(
-            x_pos=float(coords.x),
-            amplitude=canvas_dim.height / 10,
-            period_mod=sinusoidal_period_length_to_mod(canvas_dim.width / 12),
-            horiz_shift=0.0,
-            vert_shift=canvas_dim.height / 2.0 - sprite_dim.height / 2.0,
+    coords.y = sinusoidal_path(
+        canvas_dim.width, canvas_dim.height, sprite_dim.width, sprite_dim.height
+    )[coords.x - (1 - sprite_dim.width)]
+    return coords
+
+
+@lru_cache(maxsize=8)
+def sinusoidal_path(
+    canvas_width: int, canvas_height: int, sprite_width: int, sprite_height: int
+) -> tuple[int, ...]:
+    """Precompute the sprite's y coord for every x coord it walks through, from
+    just off the left edge of the canvas to just off the right edge.
+
+    Index the result with x - (1 - sprite_width).
+    """
+    period_mod = sinusoidal_period_length_to_mod(canvas_width / 12)
+    vert_shift = canvas_height / 2.0 - sprite_height / 2.0
+    return tuple(
+        int(
+            sinusoidal_fn(
+                x_pos=float(x),
+                amplitude=canvas_height / 10,
+                period_mod=period_mod,
+                horiz_shift=0.0,
+                vert_shift=vert_shift,
+            )
         )
+        for x in range(1 - sprite_width, canvas_width + 2)
     )
-    return coords
 
 
-@lru_cache(maxsize=4096)
 def sinusoidal_fn(
     x_pos: float,
     amplitude: float = 1.0,
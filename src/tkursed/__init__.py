@@ -1,6 +1,11 @@
 """Package implementing a 2D renderer implemented as a Tkinter widget."""
 
-from tkursed._consts import BITS_PER_PIXEL, BPP, EVENT_SEQUENCE_TICK  # noqa: F401
+from tkursed._consts import (  # noqa: F401
+    BITS_PER_PIXEL,
+    BPP,
+    BYTES_PER_PIXEL,
+    EVENT_SEQUENCE_TICK,
+)
 from tkursed._render import Renderer  # noqa: F401
 from tkursed._state import (  # noqa: F401
     BaseState,
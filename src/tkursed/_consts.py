@@ -8,6 +8,9 @@ BPP: Final[int] = 32
 BITS_PER_PIXEL: Final[int] = BPP
 """The amount of bits per pixel in a RGBA pixeldata."""
 
+BYTES_PER_PIXEL: Final[int] = BPP // 8
+"""The amount of bytes per pixel in a RGBA pixeldata."""
+
 EVENT_SEQUENCE_TICK: Final[str] = "<<tkursedtick>>"
 """Tkinter Event Sequence of Tkursed's rendering loop.
 
@@ -12,8 +12,9 @@ def rgba_bytes_to_PIL_image(
 ) -> PIL.Image.Image:
     """Create a PIL Image from RGBA pixeldata.
 
-    If data is a bytearray, the resulting image is created with a reference
-    to it; mutating the bytearray data directly mutates the wrapping PIL Image.
+    If data is a bytes or bytearray, the resulting image is created with a
+    reference to it rather than a copy; mutating the bytearray data directly
+    mutates the wrapping PIL Image.
 
     Arguments:
         data -- ByteString: RGBA pixeldata
@@ -34,7 +35,7 @@ def rgba_bytes_to_PIL_image(
     if dimensions[1] <= 0:
         raise ValueError("nonpositive dimensions[1] (height)")
 
-    expected_len = dimensions[0] * dimensions[1] * _consts.BITS_PER_PIXEL // 8
+    expected_len = dimensions[0] * dimensions[1] * _consts.BYTES_PER_PIXEL
     if len(data) != expected_len:
         raise ValueError(
             "unexpected data len for given dimensions",
@@ -42,7 +43,7 @@ def rgba_bytes_to_PIL_image(
             ("actual", len(data)),
         )
 
-    if isinstance(data, bytearray):
+    if isinstance(data, (bytes, bytearray)):
         fn = PIL.Image.frombuffer
     else:
         fn = PIL.Image.frombytes
@@ -24,13 +24,15 @@ def moving_count(
     if window_duration_ms <= 0:
         raise ValueError("nonpositive window_duration_ms")
 
-    window_duration_s = window_duration_ms / 1000.0
-    q: collections.deque[float] = collections.deque()
+    # monotonic integer nanoseconds: immune to wall-clock adjustments and no
+    # float rounding drift
+    window_duration_ns = int(window_duration_ms * 1_000_000)
+    q: collections.deque[int] = collections.deque()
 
     while True:
-        now = time.time()
+        now = time.monotonic_ns()
         q.append(now)
-        cutoff = now - window_duration_s
+        cutoff = now - window_duration_ns
         while q and q[0] < cutoff:
             q.popleft()
 
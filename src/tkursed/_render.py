@@ -1,19 +1,23 @@
-from typing import NamedTuple
+from typing import Final, NamedTuple
 
 import PIL.Image
 import PIL.ImageTk
 
 from tkursed import _consts, _image, _state
 
+_BYTES_PER_PIXEL: Final[int] = _consts.BYTES_PER_PIXEL
+
 
 class Renderer:
     """Renders a given state to a tkinter-compatible image."""
 
     __slots__ = (
         "__bg_cache",
+        "__bg_color",
         "__dimensions",
         "__frame_buffer",
         "__image",
+        "__is_background_only",
         "__tk_image",
     )
 
@@ -23,6 +27,8 @@ class Renderer:
         self.__dimensions = (0, 0)
         self.__frame_buffer = bytearray()
         self.__bg_cache = bytes()
+        self.__bg_color: _state.RGBPixel | None = None
+        self.__is_background_only = False
 
     def __bytes__(self) -> bytes:
         return bytes(self.__frame_buffer)
@@ -64,34 +70,38 @@ class Renderer:
         # for unit tests - avoid touching tk objects that require a window
         is_headless: bool = bool(kwargs.get("__is_headless", False))
 
-        # bytearrays cannot be resized once exported to C. we need to alloc
-        # a new one :-(
-        need_new_bg_cache = (
-            not self.__bg_cache or state.canvas.background_color != self.__bg_cache[:3]
-        )
-        if state.canvas.dimensions == self.__dimensions:
+        canvas = state.canvas
+        background_color = canvas.background_color
+        dimensions = canvas.dimensions
+        sprites = canvas.sprites
+
+        need_new_bg_cache = background_color != self.__bg_color
+        is_resized = dimensions != self.__dimensions
+        if need_new_bg_cache or is_resized:
+            self.__bg_color = background_color
+            self.__bg_cache = bytes((*background_color, 255)) * dimensions.area
+
+        if is_resized:
+            # bytearrays cannot be resized once exported to C. we need to alloc
+            # a new one :-( - copy the background straight in rather than
+            # zero-filling it first
+            frame_buffer = bytearray(self.__bg_cache)
+            new_frame_buffer = frame_buffer
+            self.__dimensions = dimensions.as_tuple()
+        else:
             frame_buffer = self.__frame_buffer
             new_frame_buffer = None
-        else:
-            frame_buffer = bytearray(state.canvas.dimensions.area_rgba_bytes)
-            new_frame_buffer = frame_buffer
-            self.__dimensions = state.canvas.dimensions.as_tuple()
-            need_new_bg_cache = True
 
-        if need_new_bg_cache:
-            self.__bg_cache = (
-                bytes((*state.canvas.background_color, 255))
-                * state.canvas.dimensions.area
-            )
-
-        # draw background
-        frame_buffer[:] = self.__bg_cache
+            # draw background, unless the last frame left nothing but it behind
+            if need_new_bg_cache or not self.__is_background_only:
+                frame_buffer[:] = self.__bg_cache
+        self.__is_background_only = not sprites
 
         # draw sprites
-        for sprite in state.canvas.sprites:
-            _render_visible_rows(sprite, state.canvas.dimensions, frame_buffer)
+        for sprite in sprites:
+            _render_visible_rows(sprite, dimensions, frame_buffer)
 
-        self.__draw(state.canvas.dimensions, new_frame_buffer, is_headless)
+        self.__draw(dimensions, new_frame_buffer, is_headless)
         if new_frame_buffer and not is_headless:
             return self.__tk_image
 
@@ -117,29 +127,21 @@ class _DimensionCropWindow(NamedTuple):
 def _crop_to_visible_for_dimension(
     canvas_coord: int, dimension_size: int, canvas_dimension_size: int
 ) -> _DimensionCropWindow | None:
-    window_coord: int = 0
-    window_dimension_size: int = dimension_size
-    window_canvas_coord: int = canvas_coord
-
-    # partially left/above canvas
-    if canvas_coord < 0:
+    # clamp both ends of the sprite to the canvas; this also covers sprites
+    # hanging off both edges at once
+    window_canvas_coord = canvas_coord if canvas_coord > 0 else 0
+    window_canvas_end = canvas_coord + dimension_size
+    if window_canvas_end > canvas_dimension_size:
+        window_canvas_end = canvas_dimension_size
+
+    if window_canvas_end <= window_canvas_coord:
         # entirely off screen
-        if canvas_coord + dimension_size <= 0:
-            return None
-        window_dimension_size = dimension_size - abs(canvas_coord)
-        window_coord = dimension_size - window_dimension_size
-        window_canvas_coord = 0
-    # partially right/below canvas
-    elif canvas_coord + dimension_size >= canvas_dimension_size:
-        # entirely off screen
-        if canvas_coord >= canvas_dimension_size:
-            return None
-        window_coord = 0
-        window_dimension_size = canvas_dimension_size - canvas_coord
-        window_canvas_coord = canvas_coord
+        return None
 
     return _DimensionCropWindow(
-        window_coord, window_dimension_size, window_canvas_coord
+        window_canvas_coord - canvas_coord,
+        window_canvas_end - window_canvas_coord,
+        window_canvas_coord,
     )
 
 
@@ -165,27 +167,69 @@ def _render_visible_rows(
         # image not visible
         return
 
-    sprite_i = (
-        _map_2d_coord_to_1d_index(image.dimensions.width, x_crop.coord, y_crop.coord)
-        * _consts.BPP
-        // 8
-    )
     canvas_i = (
         _map_2d_coord_to_1d_index(
             canvas_dimensions.width, x_crop.canvas_coord, y_crop.canvas_coord
         )
-        * _consts.BPP
-        // 8
+        * _BYTES_PER_PIXEL
+    )
+
+    sprite_window_width_bytes = x_crop.dimension_size * _BYTES_PER_PIXEL
+    canvas_width_bytes = canvas_dimensions.width * _BYTES_PER_PIXEL
+    canvas_rows = range(
+        canvas_i,
+        canvas_i + canvas_width_bytes * y_crop.dimension_size,
+        canvas_width_bytes,
     )
 
-    sprite_width_bytes = image.dimensions.width * _consts.BPP // 8
-    sprite_window_width_bytes = x_crop.dimension_size * _consts.BPP // 8
-    canvas_width_bytes = canvas_dimensions.width * _consts.BPP // 8
-    for row in range(y_crop.dimension_size):
-        if row > 0:
-            sprite_i += sprite_width_bytes
-            canvas_i += canvas_width_bytes
+    if image.is_opaque:
+        # nothing to blend - copy the sprite's rows straight in
+        sprite_width_bytes = image.dimensions.width * _BYTES_PER_PIXEL
+        sprite_i = (
+            _map_2d_coord_to_1d_index(
+                image.dimensions.width, x_crop.coord, y_crop.coord
+            )
+            * _BYTES_PER_PIXEL
+        )
+        window = image.pixeldata
+        window_rows = range(
+            sprite_i,
+            sprite_i + sprite_width_bytes * y_crop.dimension_size,
+            sprite_width_bytes,
+        )
+    else:
+        # alpha composite the sprite over the visible window of the frame buffer
+        composite = PIL.Image.frombytes(
+            "RGBA",
+            (x_crop.dimension_size, y_crop.dimension_size),
+            b"".join(
+                frame_buffer[row_i : row_i + sprite_window_width_bytes]
+                for row_i in canvas_rows
+            ),
+        )
+        # a 2-tuple source would blend everything from the corner to the sprite's
+        # bottom-right edge, including any part hanging off the canvas
+        composite.alpha_composite(
+            image.pil_image,
+            source=(
+                x_crop.coord,
+                y_crop.coord,
+                x_crop.coord + x_crop.dimension_size,
+                y_crop.coord + y_crop.dimension_size,
+            ),
+        )
+        window = memoryview(composite.tobytes())
+        window_rows = range(0, len(window), sprite_window_width_bytes)
+
+    # visible rows are contiguous in both buffers - copy them in one go
+    if window_rows.step == sprite_window_width_bytes == canvas_width_bytes:
+        window_bytes = sprite_window_width_bytes * y_crop.dimension_size
+        frame_buffer[canvas_i : canvas_i + window_bytes] = window[
+            window_rows.start : window_rows.start + window_bytes
+        ]
+        return
 
-        frame_buffer[canvas_i : canvas_i + sprite_window_width_bytes] = image.pixeldata[
-            sprite_i : sprite_i + sprite_window_width_bytes
+    for window_i, canvas_i in zip(window_rows, canvas_rows):
+        frame_buffer[canvas_i : canvas_i + sprite_window_width_bytes] = window[
+            window_i : window_i + sprite_window_width_bytes
         ]
@@ -1,9 +1,7 @@
 """Application state representations."""
 
 import abc
-import copy
 import dataclasses
-import functools
 import pathlib
 from typing import Any, BinaryIO, ByteString, Final, TypeVar, Union
 
@@ -107,19 +105,20 @@ class Dimensions(BaseState):
         """The area occupied by the represented dimensions in bytes, with a
         bytes-per-cartesian unit consistent with tkursed.BITS_PER_PIXEL."""
 
-        return self.area * _consts.BPP // 8
+        return self.area * _consts.BYTES_PER_PIXEL
 
     def __eq__(self, other: Any) -> bool:
-        if self is other:
-            return True
-
+        # Dimensions first - comparing to another Dimensions (or itself) is by
+        # far the common case
         if isinstance(other, Dimensions):
             return self.width == other.width and self.height == other.height
 
-        if isinstance(other, tuple) and len(other) == 2:
-            return self.width == other[0] and self.height == other[1]
+        if isinstance(other, tuple):
+            return (
+                len(other) == 2 and self.width == other[0] and self.height == other[1]
+            )
 
-        return False
+        return NotImplemented
 
     def __str__(self) -> str:
         return f"{self.width}x{self.height}"
@@ -157,6 +156,11 @@ def validate_RGBPixel(value: RGBPixel):
         A dictionary mapping fields to any validation errors. An empty, falsy
         return value indicates no validation errors were found.
     """
+    # fast path: no bits set outside the low byte means every value is in range
+    # (negative ints have every high bit set)
+    if len(value) == 3 and not (value[0] | value[1] | value[2]) & ~0xFF:
+        return {}
+
     errors: ValidationErrors = {}
     for i, pixel in enumerate(value):
         if not 0 <= pixel <= 255:
@@ -174,18 +178,35 @@ _IMAGE_DEFAULT_NAME: Final[str] = "(untitled)"
 class Image(BaseState):
     """An image to render on the canvas."""
 
-    __slots__ = ("__pixeldata", "__dimensions", "pixeldata", "__name")
+    __slots__ = (
+        "__pixeldata",
+        "__dimensions",
+        "pixeldata",
+        "__name",
+        "__pil_image",
+        "__is_opaque",
+    )
 
     @property
     def dimensions(self) -> Dimensions:
         """The dimensions of the image for reference."""
         return self.__dimensions
 
+    @property
+    def is_opaque(self) -> bool:
+        """Whether every pixel of the image is fully opaque (alpha of 255)."""
+        return self.__is_opaque
+
     @property
     def name(self) -> str:
         """The name of the image as supplied in initialization, for reference.."""
         return self.__name
 
+    @property
+    def pil_image(self) -> PIL.Image.Image:
+        """A read-only PIL Image sharing the image's pixeldata, for compositing."""
+        return self.__pil_image
+
     def __init__(
         self,
         image: PIL.Image.Image | FileOrPath,
@@ -213,12 +234,14 @@ class Image(BaseState):
 
         image = image.convert("RGBA")
 
-        # getdata gives us a list of pixel tuples
-        self.__pixeldata = functools.reduce(
-            lambda acc, v: acc + bytes(v), image.getdata(), bytearray()
-        )
-        self.pixeldata = memoryview(self.__pixeldata).toreadonly()
+        # tobytes hands back the raw RGBA buffer in a single C-level copy
+        self.__pixeldata = image.tobytes("raw", "RGBA")
+        self.pixeldata = memoryview(self.__pixeldata)
         self.__dimensions = Dimensions(image.width, image.height)
+        self.__pil_image = _image.rgba_bytes_to_PIL_image(
+            self.__pixeldata, self.__dimensions.as_tuple()
+        )
+        self.__is_opaque = self.__pil_image.getchannel("A").getextrema()[0] == 255
         self.__name = name
         super().__post_init__()
 
@@ -229,11 +252,15 @@ class Image(BaseState):
         if isinstance(other, Image):
             return (
                 self.dimensions == other.dimensions
-                and self.pixeldata == other.pixeldata
+                and self.__pixeldata == other.__pixeldata
             )
 
         return False
 
+    def __hash__(self) -> int:
+        # equal images have equal pixeldata; bytes caches its own hash
+        return hash(self.__pixeldata)
+
     def __str__(self) -> str:
         return f"<image: {self.__name or _IMAGE_DEFAULT_NAME} {self.__dimensions}>"
 
@@ -287,10 +314,15 @@ class Sprite(BaseState):
 
     @active.setter
     def active(self, value: Image) -> None:
+        # identity is far cheaper than comparing pixeldata and is the common case
         new_active_key: str | None = next(
-            (k for k, v in self.images.items() if v == value), None
+            (k for k, v in self.images.items() if v is value), None
         )
-        if not new_active_key:
+        if new_active_key is None:
+            new_active_key = next(
+                (k for k, v in self.images.items() if v == value), None
+            )
+        if new_active_key is None:
             raise ValueError(
                 "value not in images dict' values",
                 ("value", value),
@@ -357,7 +389,7 @@ class Sprite(BaseState):
                 child_errors[k] = err
 
         if child_errors:
-            errors["images"] = child_errors.copy()
+            errors["images"] = child_errors
 
         return errors
 
@@ -396,7 +428,7 @@ class PositionedSprite(Sprite):
         self.coordinates = coordinates
 
         if isinstance(images, Sprite):
-            super().__init__(copy.copy(images.images), images.active_key, images.name)
+            super().__init__(images.images.copy(), images.active_key, images.name)
         else:
             super().__init__(images, active_key, name)
 
@@ -439,18 +471,18 @@ class Canvas(BaseState):
         errors: ValidationErrors = {}
 
         if child_errors := self.dimensions.validate():
-            errors["dimensions"] = child_errors.copy()
+            errors["dimensions"] = child_errors
 
         if child_errors := validate_RGBPixel(self.background_color):
-            errors["background_color"] = child_errors.copy()
+            errors["background_color"] = child_errors
 
-        if child_errors := dict(
-            filter(
-                lambda iv: iv[1],
-                ((str(i), v.validate()) for i, v in enumerate(self.sprites)),
-            )
-        ):
-            errors["sprites"] = dict(child_errors)
+        sprite_errors: ValidationErrors = {}
+        for i, sprite in enumerate(self.sprites):
+            if child_errors := sprite.validate():
+                sprite_errors[str(i)] = child_errors
+
+        if sprite_errors:
+            errors["sprites"] = sprite_errors
 
         return errors
 
@@ -468,7 +500,7 @@ class State(BaseState):
         errors: ValidationErrors = {}
 
         if child_errors := self.canvas.validate():
-            errors["canvas"] = child_errors.copy()
+            errors["canvas"] = child_errors
 
         if self.frame_rate < 0:
             errors["frame_rate"] = ValueError(
@@ -4,19 +4,24 @@ import tkinter
 import tkinter.messagebox
 import tkinter.ttk
 import traceback
-from typing import cast
+from typing import Final
 
 from tkursed import _consts, _metrics, _render, _state
 
 AfterKey = str
 
+_EVENT_SEQUENCE_TICK: Final[str] = _consts.EVENT_SEQUENCE_TICK
+
 
 class Tkursed(tkinter.ttk.Frame):
     """A tkinter widget of a dynamic software-rendered image."""
 
     __slots__ = (
+        "__configure_key",
+        "__configure_dimensions",
         "__framerate_monitor",
         "__image_label",
+        "__logic_loop_command",
         "__loop_interval_key",
         "__renderer",
         "__run",
@@ -51,16 +56,23 @@ class Tkursed(tkinter.ttk.Frame):
         Raises:
             ValueError: nonpositive width, height, or tick_rate_ms
         """
-        for arg_key in ("width", "height", "tick_rate_ms"):
-            arg_val: int = cast(int, locals().get(arg_key))
-
+        for arg_key, arg_val in (
+            ("width", width),
+            ("height", height),
+            ("tick_rate_ms", tick_rate_ms),
+        ):
             if arg_val <= 0:
                 raise ValueError(f"nonpositive {arg_key}")
 
         kwargs.update(width=width, height=height, class_=self.__class__.__name__)
         super().__init__(*args, **kwargs)
 
+        self.__configure_key: AfterKey | None = None
+        self.__configure_dimensions = (width, height)
         self.__loop_interval_key: AfterKey | None = None
+        # registered once and rescheduled by name; after() would register and
+        # delete a fresh Tcl command for every tick
+        self.__logic_loop_command = self.register(self.__logic_loop)
         self.__run = False
         self.is_dirty = False
         self.tick = 0
@@ -88,19 +100,32 @@ class Tkursed(tkinter.ttk.Frame):
         self.bind("<Map>", self.__handle_frame_map)
         self.bind("<Unmap>", self.__handle_frame_unmap)
 
-    def __handle_frame_configure(self, event: tkinter.Event) -> None:
-        self.tkursed_state.canvas.dimensions = _state.Dimensions(
-            event.width, event.height
-        )
+    def __apply_frame_configure(self) -> None:
+        self.__configure_key = None
+        width, height = self.__configure_dimensions
+        if self.tkursed_state.canvas.dimensions == self.__configure_dimensions:
+            # moved, restacked or re-mapped - nothing to re-render
+            return
+
+        self.tkursed_state.canvas.dimensions = _state.Dimensions(width, height)
         self.__image_label.place(
             anchor=tkinter.NW,
-            width=event.width,
-            height=event.height,
+            width=width,
+            height=height,
         )
         self.is_dirty = True
 
+    def __handle_frame_configure(self, event: tkinter.Event) -> None:
+        # window drags fire bursts of these; only apply the last one once idle
+        self.__configure_dimensions = (event.width, event.height)
+        if not self.__configure_key:
+            self.__configure_key = self.after_idle(self.__apply_frame_configure)
+
     def __handle_frame_destroy(self, event: tkinter.Event) -> None:
         self.stop()
+        if key := self.__configure_key:
+            self.__configure_key = None
+            self.after_cancel(key)
 
     def __handle_frame_map(self, event: tkinter.Event) -> None:
         self.start()
@@ -108,42 +133,46 @@ class Tkursed(tkinter.ttk.Frame):
     def __handle_frame_unmap(self, event: tkinter.Event) -> None:
         self.stop()
 
-    def __logic_loop(self, tick: int) -> None:
+    def __logic_loop(self) -> None:
         if not self.__run:
             self.stop()
             return
 
-        self.tick = tick + 1
-        self.__loop_interval_key = self.after(
-            self.tkursed_state.tick_rate_ms, self.__logic_loop, tick + 1
+        state = self.tkursed_state
+        self.tick += 1
+        self.__loop_interval_key = self.tk.call(
+            "after", state.tick_rate_ms, self.__logic_loop_command
         )
-        self.event_generate(_consts.EVENT_SEQUENCE_TICK, when="tail")
+        self.event_generate(_EVENT_SEQUENCE_TICK, when="tail")
 
         if self.is_dirty:
-            if validation_errors := self.tkursed_state.validate():
+            if validation_errors := state.validate():
                 self.stop()
                 self.is_dirty = False
                 raise _state.InvalidStateError(validation_errors)
 
-            if new_tk_image := self.__renderer.render(self.tkursed_state):
+            if new_tk_image := self.__renderer.render(state):
                 self.__image_label.configure(image=new_tk_image)
 
             self.is_dirty = False
 
-        self.tkursed_state.frame_rate = next(self.__framerate_iter)
+        state.frame_rate = next(self.__framerate_iter)
 
     def start(self) -> None:
         """Idempotently start the rendering loop."""
         self.__run = True
         if not self.__loop_interval_key:
-            self.__loop_interval_key = self.after_idle(self.__logic_loop, self.tick)
+            self.__loop_interval_key = self.tk.call(
+                "after", "idle", self.__logic_loop_command
+            )
 
     def stop(self) -> None:
         """Idempotently stop the rendering loop."""
         self.__run = False
         if key := self.__loop_interval_key:
             self.__loop_interval_key = None
-            self.after_cancel(key)
+            # not after_cancel - it would delete the registered command too
+            self.tk.call("after", "cancel", key)
 
 
 class SimpleTkursedWindow(tkinter.Tk, metaclass=abc.ABCMeta):
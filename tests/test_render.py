@@ -3,7 +3,6 @@ from typing import Final, Iterator, TypeVar
 import pytest
 
 import tkursed
-from tkursed._consts import BPP
 
 T = TypeVar("T")
 
@@ -38,7 +37,7 @@ def render_state_to_pixeldata_rows(
         renderer = tkursed.Renderer()
     renderer.render(state, __is_headless=True)
     buf = bytes(renderer)
-    step_size = state.canvas.dimensions.width * BPP // 8
+    step_size = state.canvas.dimensions.width * tkursed.BYTES_PER_PIXEL
     for i in range(0, len(buf), step_size):
         yield buf[i : i + step_size]
 
@@ -186,3 +185,118 @@ def test_sprite_off_canvas(state: tkursed.State) -> None:
     unit.render(state, __is_headless=True)
 
     assert bytes(unit) == DEFAULT_CANVAS_PIXEL_RGBA * state.canvas.dimensions.area
+
+
+def test_background_color_change(state: tkursed.State) -> None:
+    state.canvas.sprites = []
+
+    unit = tkursed.Renderer()
+    for color in ((1, 2, 3), (1, 2, 3), (4, 5, 6)):
+        state.canvas.background_color = color
+        unit.render(state, __is_headless=True)
+
+        assert bytes(unit) == bytes((*color, 255)) * state.canvas.dimensions.area
+
+
+def test_sprite_render_full_canvas_width(state: tkursed.State) -> None:
+    sprite = state.canvas.sprites[0]
+    sprite.coordinates.y = 1
+    state.canvas.dimensions = tkursed.Dimensions(
+        sprite.active.dimensions.width, state.canvas.dimensions.height
+    )
+
+    expected_bg_row = DEFAULT_CANVAS_PIXEL_RGBA * state.canvas.dimensions.width
+    expected_sprite_row = DEFAULT_SPRITE_PIXEL_RGBA * sprite.active.dimensions.width
+
+    for i, row in enumerate(render_state_to_pixeldata_rows(state)):
+        if 1 <= i < 1 + sprite.active.dimensions.height:
+            assert row == expected_sprite_row
+        else:
+            assert row == expected_bg_row
+
+
+def test_sprite_alpha_composite(state: tkursed.State) -> None:
+    sprite_dim = state.canvas.sprites[0].active.dimensions
+    state.canvas.sprites[0] = tkursed.PositionedSprite(
+        tkursed.Image.from_rgba_pixeldata(
+            bytes((*DEFAULT_SPRITE_PIXEL, 0)) * sprite_dim.area, sprite_dim
+        ),
+        tkursed.Coordinates(1, 1),
+    )
+
+    unit = tkursed.Renderer()
+    unit.render(state, __is_headless=True)
+
+    assert bytes(unit) == DEFAULT_CANVAS_PIXEL_RGBA * state.canvas.dimensions.area
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [
+        tkursed.Coordinates(0, 0),
+        tkursed.Coordinates(1, 1),
+        tkursed.Coordinates(3, 3),
+        tkursed.Coordinates(-2, -2),
+    ],
+)
+def test_sprite_alpha_composite_partial(
+    state: tkursed.State, coords: tkursed.Coordinates
+) -> None:
+    sprite_dim = state.canvas.sprites[0].active.dimensions
+    state.canvas.sprites[0] = tkursed.PositionedSprite(
+        tkursed.Image.from_rgba_pixeldata(
+            bytes((*DEFAULT_SPRITE_PIXEL, 128)) * sprite_dim.area, sprite_dim
+        ),
+        coords,
+    )
+
+    canvas_dim = state.canvas.dimensions
+    blended_pixel = bytes((128, 128, 128, 255))
+    expected = bytearray(DEFAULT_CANVAS_PIXEL_RGBA * canvas_dim.area)
+    for y in range(
+        max(coords.y, 0), min(coords.y + sprite_dim.height, canvas_dim.height)
+    ):
+        for x in range(
+            max(coords.x, 0), min(coords.x + sprite_dim.width, canvas_dim.width)
+        ):
+            i = (x + y * canvas_dim.width) * tkursed.BYTES_PER_PIXEL
+            expected[i : i + tkursed.BYTES_PER_PIXEL] = blended_pixel
+
+    unit = tkursed.Renderer()
+    unit.render(state, __is_headless=True)
+
+    assert bytes(unit) == bytes(expected)
+
+
+def test_sprite_cropping_x_both(state: tkursed.State) -> None:
+    sprite_dim = tkursed.Dimensions(state.canvas.dimensions.width + 2, 1)
+    state.canvas.sprites[0] = tkursed.PositionedSprite(
+        tkursed.Image.from_rgba_pixeldata(
+            DEFAULT_SPRITE_PIXEL_RGBA * sprite_dim.area, sprite_dim
+        ),
+        tkursed.Coordinates(-1, 0),
+    )
+
+    canvas_width = state.canvas.dimensions.width
+    expected_bg_row = DEFAULT_CANVAS_PIXEL_RGBA * canvas_width
+    expected_sprite_row = DEFAULT_SPRITE_PIXEL_RGBA * canvas_width
+
+    unit = tkursed.Renderer()
+    rows = list(render_state_to_pixeldata_rows(state, unit))
+    assert len(bytes(unit)) == state.canvas.dimensions.area_rgba_bytes
+    for i, row in enumerate(rows):
+        if i < sprite_dim.height:
+            assert row == expected_sprite_row
+        else:
+            assert row == expected_bg_row
+
+
+def test_sprite_removal(state: tkursed.State) -> None:
+    unit = tkursed.Renderer()
+    unit.render(state, __is_headless=True)
+
+    state.canvas.sprites = []
+    for _ in range(2):
+        unit.render(state, __is_headless=True)
+
+        assert bytes(unit) == DEFAULT_CANVAS_PIXEL_RGBA * state.canvas.dimensions.area
@@ -115,6 +115,27 @@ def test_sprite_construction(sample_image: tkursed.Image):
         assert sample_image is unit.images["foo"]
 
 
+def test_sprite_active_setter(sample_image: tkursed.Image):
+    other_image = tkursed.Image.from_rgba_pixeldata(
+        bytes((0, 0, 255, 255)), tkursed.Dimensions(1, 1)
+    )
+    unit = tkursed.Sprite({"": sample_image, "other": other_image}, active_key="other")
+
+    unit.active = sample_image
+    assert unit.active_key == ""
+
+    unit.active = tkursed.Image(sample_image.pil_image)
+    assert unit.active_key == ""
+
+    unit.active = other_image
+    assert unit.active_key == "other"
+
+    with pytest.raises(ValueError):
+        unit.active = tkursed.Image.from_rgba_pixeldata(
+            bytes((0, 255, 0, 255)), tkursed.Dimensions(1, 1)
+        )
+
+
 @pytest.mark.parametrize(
     "state_klasslike, attr_overrides",
     [
@@ -132,3 +153,50 @@ def test_validation(
 ):
     unit = mutate_instance_attrs(state_klasslike, attr_overrides)
     assert unit.validate().keys() == {k for k, _ in attr_overrides}
+
+
+@pytest.mark.parametrize(
+    "alpha, is_opaque",
+    [
+        [255, True],
+        [254, False],
+        [0, False],
+    ],
+)
+def test_image_is_opaque(alpha: int, is_opaque: bool):
+    unit = tkursed.Image.from_rgba_pixeldata(
+        bytes((255, 0, 0, 255)) * 3 + bytes((255, 0, 0, alpha)),
+        tkursed.Dimensions(2, 2),
+    )
+    assert unit.is_opaque is is_opaque
+
+
+def test_image_equality(sample_image: tkursed.Image):
+    assert sample_image == tkursed.Image(sample_image.pil_image)
+    assert sample_image != tkursed.Image.from_rgba_pixeldata(
+        bytes((0, 0, 255, 255)) * sample_image.dimensions.area,
+        sample_image.dimensions,
+    )
+    assert sample_image != tkursed.Image.from_rgba_pixeldata(
+        bytes((255, 0, 0, 255)), tkursed.Dimensions(1, 1)
+    )
+
+
+def test_image_hash(sample_image: tkursed.Image):
+    same_image = tkursed.Image(sample_image.pil_image)
+    assert hash(sample_image) == hash(same_image)
+    assert len({sample_image, same_image}) == 1
+
+
+@pytest.mark.parametrize(
+    "other, is_equal",
+    [
+        [tkursed.Dimensions(1, 2), True],
+        [tkursed.Dimensions(2, 1), False],
+        [(1, 2), True],
+        [(1, 2, 3), False],
+        ["1x2", False],
+    ],
+)
+def test_dimensions_equality(other: Any, is_equal: bool):
+    assert (tkursed.Dimensions(1, 2) == other) is is_equal
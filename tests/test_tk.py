@@ -70,7 +70,8 @@ class UnitTestWindow(tkinter.Toplevel):
         self.unit_test_ex_handler = unit_test_ex_handler
         self.child_destroyed = False
         self.bind(tkursed.EVENT_SEQUENCE_TICK, self.handle_tick)
-        self.tkursed.bind(EVENT_SEQUENCE_DESTROY, self.__handle_destroy_child)
+        # add, rather than replace Tkursed's own <Destroy> handling
+        self.tkursed.bind(EVENT_SEQUENCE_DESTROY, self.__handle_destroy_child, add="+")
         self.withdraw()
 
     def handle_tick(self, event: tkinter.Event) -> None:
@@ -194,3 +195,111 @@ def test_validation_failure_stops_logic_loop(
     assert len(exceptions) == 1
     ex = exceptions.pop()
     assert isinstance(ex, tkursed.InvalidStateError)
+
+
+class CountingRenderer:
+    def __init__(self, renderer: tkursed.Renderer) -> None:
+        self.renderer = renderer
+        self.render_count = 0
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.renderer)
+
+    def render(self, *args, **kwargs):
+        self.render_count += 1
+        return self.renderer.render(*args, **kwargs)
+
+
+def test_configure_burst_renders_last_size_once(
+    ut_root: UnitTestRoot,
+    ut_window_factory: Callable[
+        [unit_test_tick_handler_t, unit_test_ex_handler_t], UnitTestWindow
+    ],
+):
+    sizes = ((400, 300), (500, 350), (640, 480))
+    renderer: CountingRenderer | None = None
+
+    def tick_handler(window: tkinter.Toplevel, unit: tkursed.Tkursed):
+        nonlocal renderer
+        if unit.tick == 2:
+            # let any real geometry management settle before the burst
+            window.update_idletasks()
+            renderer = CountingRenderer(unit._Tkursed__renderer)  # type: ignore
+            unit._Tkursed__renderer = renderer  # type: ignore
+
+            old_dimensions = unit.tkursed_state.canvas.dimensions.as_tuple()
+            for width, height in sizes:
+                unit.event_generate("<Configure>", width=width, height=height)
+
+            # coalesced - nothing is applied until the event loop goes idle
+            assert unit.tkursed_state.canvas.dimensions == old_dimensions
+            assert not unit.is_dirty
+        elif unit.tick == 3:
+            assert renderer is not None
+            assert unit.tkursed_state.canvas.dimensions == sizes[-1]
+            assert renderer.render_count == 1
+            assert (
+                len(bytes(renderer)) == tkursed.Dimensions(*sizes[-1]).area_rgba_bytes
+            )
+            unit.stop()
+
+    _, exceptions = run_tkinter_test_fn(
+        ut_root=ut_root, ut_window_factory=ut_window_factory, tick_handler=tick_handler
+    )
+    assert len(exceptions) == 0
+    assert renderer is not None and renderer.render_count == 1
+
+
+def test_configure_same_size_is_not_dirty(
+    ut_root: UnitTestRoot,
+    ut_window_factory: Callable[
+        [unit_test_tick_handler_t, unit_test_ex_handler_t], UnitTestWindow
+    ],
+):
+    dimensions: tuple[int, int] | None = None
+
+    def tick_handler(window: tkinter.Toplevel, unit: tkursed.Tkursed):
+        nonlocal dimensions
+        if unit.tick == 2:
+            # let any real geometry management settle, and render it next tick
+            window.update_idletasks()
+        elif unit.tick == 3:
+            assert not unit.is_dirty
+            dimensions = unit.tkursed_state.canvas.dimensions.as_tuple()
+            width, height = dimensions
+            unit.event_generate("<Configure>", width=width, height=height)
+            window.update_idletasks()
+
+            assert not unit.is_dirty
+            assert unit.tkursed_state.canvas.dimensions == dimensions
+            unit.stop()
+
+    _, exceptions = run_tkinter_test_fn(
+        ut_root=ut_root, ut_window_factory=ut_window_factory, tick_handler=tick_handler
+    )
+    assert len(exceptions) == 0
+    assert dimensions is not None
+
+
+def test_destroy_cancels_pending_configure(
+    ut_root: UnitTestRoot,
+    ut_window_factory: Callable[
+        [unit_test_tick_handler_t, unit_test_ex_handler_t], UnitTestWindow
+    ],
+):
+    pending_before: set[str] = set()
+
+    def tick_handler(window: tkinter.Toplevel, unit: tkursed.Tkursed):
+        nonlocal pending_before
+        if unit.tick == 2:
+            window.update_idletasks()
+            pending_before = set(ut_root.tk.splitlist(ut_root.tk.call("after", "info")))
+            unit.event_generate("<Configure>", width=320, height=200)
+            unit.destroy()
+
+    _, exceptions = run_tkinter_test_fn(
+        ut_root=ut_root, ut_window_factory=ut_window_factory, tick_handler=tick_handler
+    )
+    assert len(exceptions) == 0
+    pending_after = set(ut_root.tk.splitlist(ut_root.tk.call("after", "info")))
+    assert pending_after <= pending_before